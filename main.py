@@ -1,14 +1,35 @@
 # server.py
 from fastmcp import FastMCP
 from typing import Optional, Literal, List
-from pydantic import BaseModel, Field
+import asyncio
+import base64
 import httpx
+import msgspec
+import orjson
 import os
 import logging
+import operator
+import re
+import socket
 import sys
+import threading
+import time
 from dotenv import load_dotenv
-from google import genai
-from google.genai import types
+from pydantic import TypeAdapter, ValidationError
+
+from strategy_models import (
+    ADVANCED_DEFAULTS,
+    LONG_DESC,
+    MIX_DERIV,
+    MIX_EQ,
+    PARAM_TO_PAYLOAD,
+    SHORT_DESC,
+    ScalpingAdvanced,
+    ScalpingParams,
+    StrategiesPage,
+    StrategyOut,
+    make_payload,
+)
 
 load_dotenv()
 
@@ -20,90 +41,241 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mcp_server")
 
-mcp = FastMCP("Trading Strategy MCP")
+# Reused encoder state (buffer, caches) for every tool result
+_RESULT_ENCODER = msgspec.json.Encoder()
+
+
+def _serialize_tool_result(data) -> str:
+    """msgspec-backed serializer for tool return values (C encoder instead
+    of FastMCP's stdlib-json default); encodes msgspec Structs natively."""
+    return _RESULT_ENCODER.encode(data).decode()
+
+
+mcp = FastMCP("Trading Strategy MCP", tool_serializer=_serialize_tool_result)
 
 # API Configuration
 API_BASE_URL = "https://api.marketmaya.com/api"
 BEARER_TOKEN = os.getenv("BEARER_TOKEN", "")
 
-logger.info(f"MCP Server initialized. API_BASE_URL: {API_BASE_URL}")
-logger.info(f"BEARER_TOKEN configured: {'Yes' if BEARER_TOKEN else 'NO - MISSING!'}")
+# API paths (relative to the clients' base_url), built once so post
+# sites stay constant-only on the hot path
+_URL_CREATE_SCALPING = "/mainStrategy/createScalpingStrategy"
+_URL_GET_MY_STRATEGIES = "/V3/mainStrategy/getClientMyStrategy"
+_URL_GET_POINT_BALANCE = "/client/v2/getPointBalance"
+_URL_GET_BACKTEST_OPTIONS = "/subscription/getBacktestOptions"
+_LOG_CALL_CREATE_SCALPING = f"📤 Calling API: {API_BASE_URL}{_URL_CREATE_SCALPING}"
+
+logger.info("MCP Server initialized. API_BASE_URL: %s", API_BASE_URL)
+logger.info("BEARER_TOKEN configured: %s", "Yes" if BEARER_TOKEN else "NO - MISSING!")
+
+
+# Auth headers are cached with a short TTL: cheap on the hot path, but a
+# rotated BEARER_TOKEN in the environment is picked up without a restart.
+_AUTH_TTL = 30.0
+_AUTH_CACHE: Optional[tuple] = None
+
+
+def _cached_auth_headers() -> dict:
+    """Return the auth headers, rebuilding them at most every _AUTH_TTL s."""
+    global _AUTH_CACHE
+    now = time.monotonic()
+    if _AUTH_CACHE is None or now - _AUTH_CACHE[0] > _AUTH_TTL:
+        _AUTH_CACHE = (
+            now,
+            {
+                "Authorization": f"Bearer {os.getenv('BEARER_TOKEN', '')}",
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/plain, */*",
+            },
+        )
+    return _AUTH_CACHE[1]
+
+
+def _invalidate_auth_cache() -> None:
+    """Drop the cached headers (e.g. after a 401) so the next call rereads
+    the token from the environment."""
+    global _AUTH_CACHE
+    _AUTH_CACHE = None
+
+
+# Disable Nagle (small JSON POSTs would otherwise stall up to ~40 ms
+# waiting for an ACK) and keep idle pooled connections alive so reuse
+# skips both the handshake and the DNS lookup.
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=40,
+    keepalive_expiry=60.0,
+)
+_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Shared HTTP client, created lazily so it binds to the running event
+# loop; consecutive tool calls reuse the same TCP+TLS connection instead
+# of paying a fresh handshake per request. FastMCP awaits async tools
+# natively, so network waits from concurrent tool calls can overlap
+# instead of blocking the loop.
+_ACLIENT: Optional[httpx.AsyncClient] = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _ACLIENT
+    if _ACLIENT is None:
+        _ACLIENT = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            timeout=_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=_LIMITS,
+                socket_options=_SOCKET_OPTIONS,
+            ),
+        )
+    return _ACLIENT
+
 
+def _loads(response: httpx.Response):
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(response.content)
 
-def get_auth_headers() -> dict:
-    """Get authorization headers for API calls"""
-    return {
-        "Authorization": f"Bearer {BEARER_TOKEN}",
-        "Content-Type": "application/json",
-        "Accept": "application/json, text/plain, */*",
-    }
+
+# Request-body encoder, built once so its buffer and caches are reused
+# across calls instead of per-call (the Content-Type header is already
+# part of _cached_auth_headers)
+_REQUEST_ENCODER = msgspec.json.Encoder()
+
+
+async def _post(path: str, payload) -> httpx.Response:
+    """POST a JSON-encoded payload through the shared AsyncClient."""
+    client = await _get_client()
+    return await client.post(
+        path,
+        headers=_cached_auth_headers(),
+        content=_REQUEST_ENCODER.encode(payload),
+    )
+
+
+# Transient upstream failures worth a silent retry; anything else is
+# surfaced immediately. Retrying here costs ~100-400 ms versus a full
+# LLM round-trip if the error reaches the agent. Exception-triggered
+# retries are limited to connect failures, where the request was never
+# sent — a read/write error may mean the server already processed a
+# non-idempotent POST (e.g. createScalpingStrategy), and retrying it
+# would duplicate a live strategy.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.1
+
+
+async def _call_api(path: str, payload, *, decoder=_loads) -> dict:
+    """POST to the API with uniform transport/HTTP error handling.
+
+    Returns {"status": "success", "data": <decoded body>} on 200, or
+    {"status": "error", "message": ...} for anything else, so the tools
+    only shape their success responses instead of each repeating the
+    try/except plumbing. Transient failures (connect errors, 429/5xx)
+    are retried with exponential backoff before an error is returned.
+    """
+    for attempt in range(_RETRY_ATTEMPTS):
+        backoff = _RETRY_BASE_DELAY * (4**attempt)
+        try:
+            response = await _post(path, payload)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            if attempt == _RETRY_ATTEMPTS - 1:
+                logger.error(
+                    "❌ API call to %s failed after %d attempts: %s",
+                    path,
+                    _RETRY_ATTEMPTS,
+                    e,
+                )
+                return {"status": "error", "message": f"API call to {path} failed: {e}"}
+            await asyncio.sleep(backoff)
+            continue
+        except httpx.TransportError as e:
+            # Not retried: the request may have reached the server
+            logger.error("❌ API call to %s failed: %s", path, e)
+            return {"status": "error", "message": f"API call to {path} failed: {e}"}
+        except Exception:
+            logger.exception("❌ API call to %s failed", path)
+            return {"status": "error", "message": f"API call to {path} failed"}
+
+        if (
+            response.status_code in _RETRY_STATUSES
+            and attempt < _RETRY_ATTEMPTS - 1
+        ):
+            # Honor Retry-After on 429s when the server provides one
+            retry_after = response.headers.get("Retry-After")
+            try:
+                delay = float(retry_after) if retry_after else backoff
+            except ValueError:
+                delay = backoff
+            await asyncio.sleep(min(delay, 5.0))
+            continue
+        break
+
+    if response.status_code == 401:
+        _invalidate_auth_cache()
+    if response.status_code != 200:
+        # Parse the error body exactly once; fall back to the raw bytes
+        # only when it isn't JSON or carries no message
+        raw = response.content
+        try:
+            error_data = orjson.loads(raw)
+            error_msg = (
+                error_data.get("message")
+                or error_data.get("error")
+                or raw.decode("utf-8", "replace")
+            )
+        except Exception:
+            error_msg = raw.decode("utf-8", "replace")
+        logger.error("❌ API Error %s: %s", response.status_code, error_msg)
+        return {"status": "error", "message": f"API error: {error_msg}"}
+
+    try:
+        return {"status": "success", "data": decoder(response)}
+    except Exception:
+        logger.exception("❌ Failed to decode response from %s", path)
+        return {"status": "error", "message": f"Invalid response from {path}"}
 
 
 # ============================================================================
 # SCALPING STRATEGY TOOL
 # ============================================================================
 
+# Valid values for the advanced enum parameters. These are typed as plain
+# str in the tool signature (their values are enumerated in the
+# docstring) so schema validation per call reduces to one frozenset
+# membership test each instead of a Literal validator dispatch.
+_CONTRACTS = frozenset({"NEAR", "NEXT", "FAR"})
+_EXPIRIES = frozenset({"MONTHLY", "WEEKLY"})
+_PRODUCT_TYPES = frozenset({"NRML", "MIS", "CNC"})
+_ORDER_TYPES = frozenset({"Market Order", "Limit Order"})
+_BY_TYPES = frozenset({"Point", "Percent"})
+_INCREASE_QTY_TYPES = frozenset({"Qty", "Lot"})
+_OPTION_TYPES = frozenset({"CE", "PE"})
+
+# Compiled once at import; coerces advanced values onto the TypedDict
+# types (agents routinely stringify numbers) instead of letting a bad
+# value blow up mid-payload-build.
+_SCALPING_ADVANCED = TypeAdapter(ScalpingAdvanced)
+
 
 @mcp.tool()
-def create_scalping_strategy(
+async def create_scalping_strategy(
     strategy_name: str,
     symbol: str,
     exchange: Literal["NSE", "MCX", "BSE"] = "NSE",
     segment: Literal["EQ", "FUT", "OPT"] = "EQ",
-    contract: Literal["NEAR", "NEXT", "FAR"] = "NEAR",
-    expiry: Literal["MONTHLY", "WEEKLY"] = "MONTHLY",
+    side: Literal["BUY", "SELL"] = "BUY",
     averaging_points: int = 100,
-    avg_points: Optional[int] = None,  # Alias for averaging_points
     target_points: int = 100,
     max_steps: int = 50,
     quantity: int = 1,
     lot: int = 1,
-    side: Literal["BUY", "SELL"] = "BUY",
-    is_intraday: bool = True,
-    intraday_entry_time: str = "9:16",
-    intraday_exit_time: str = "15:25",
-    required_margin: int = 100000,
-    product_type: Literal["NRML", "MIS", "CNC"] = "NRML",
-    order_type: Literal["Market Order", "Limit Order"] = "Market Order",
-    # Price range settings
-    jobbing_start_price: float = 0,
-    jobbing_end_price: float = 0,
-    # Averaging settings
-    average_by: Literal["Point", "Percent"] = "Point",
-    target_by: Literal["Point", "Percent"] = "Point",
-    maximum_target_steps: int = 0,
-    sqroff_on_maximum_steps: bool = False,
-    calculate_qty_on_market_jump: bool = False,
-    # Quantity increase settings
-    increase_qty_on_avg: bool = False,
-    increase_qty: int = 0,
-    increase_qty_type: Literal["Qty", "Lot"] = "Qty",
-    scalping_opening_qty: int = 0,
-    # Limit order settings
-    no_of_limit_order_retry: int = 0,
-    retry_at_every_seconds: int = 0,
-    market_order_after_retry: bool = False,
-    # Rollover settings
-    is_auto_rollover: bool = False,
-    rollover_before_days: int = 0,
-    rollover_time: str = "0:0",
-    # Master TP/SL settings
-    reset_cycle_by_master_tpsl: bool = False,
-    master_tp_money: int = 0,
-    master_sl_money: int = 0,
-    reset_cycle_on_positive_mtm: int = 0,
-    # Trail SL settings
-    is_trail_sl: bool = False,
-    profit_move: int = 0,
-    sl_move: int = 0,
-    no_of_trail_sl: int = 0,
-    # Options settings
-    atm: int = 0,
-    strike_price: int = 0,
-    option_type: Literal["CE", "PE"] = "CE",
-    # Other settings
-    allow_update_parameters: bool = True,
-    is_add_hedge_leg: bool = False,
+    advanced: Optional[dict] = None,
 ) -> dict:
     """
     Create and deploy a scalping strategy to MarketMaya.
@@ -113,240 +285,293 @@ def create_scalping_strategy(
         symbol: Trading symbol (e.g., RELIANCE, SILVER, NIFTY)
         exchange: Exchange - NSE, MCX, or BSE (default: NSE)
         segment: Market segment - EQ (Equity), FUT (Futures), OPT (Options) (default: EQ)
-        contract: Contract type for FUT/OPT - NEAR, NEXT, FAR (default: NEAR)
-        expiry: Expiry type for FUT/OPT - MONTHLY or WEEKLY (default: MONTHLY)
+        side: Trade direction - BUY or SELL (default: BUY)
         averaging_points: Points interval for averaging down (default: 100)
         target_points: Target profit in points (default: 100)
         max_steps: Maximum number of averaging steps (default: 50)
         quantity: Quantity per trade (default: 1)
         lot: Lot size multiplier (default: 1)
-        side: Trade direction - BUY or SELL (default: BUY)
-        is_intraday: Whether this is an intraday strategy (default: False)
-        intraday_entry_time: Entry time for intraday in HH:MM format (default: "9:16")
-        intraday_exit_time: Exit time for intraday in HH:MM format (default: "15:25")
-        required_margin: Required margin for the strategy (default: 100000)
-        product_type: Product type - NRML, MIS, CNC (default: NRML)
-        order_type: Order type - Market Order or Limit Order (default: Market Order)
-        jobbing_start_price: Start price for price range (default: 0 = no limit)
-        jobbing_end_price: End price for price range (default: 0 = no limit)
-        average_by: Average calculation method - Point or Percent (default: Point)
-        target_by: Target calculation method - Point or Percent (default: Point)
-        maximum_target_steps: Max target steps before booking (default: 0)
-        sqroff_on_maximum_steps: Square off when max steps reached (default: False)
-        calculate_qty_on_market_jump: Adjust qty on market gap (default: False)
-        increase_qty_on_avg: Increase quantity on averaging (default: False)
-        increase_qty: Amount to increase quantity by (default: 0)
-        increase_qty_type: Type for qty increase - Qty or Lot (default: None)
-        scalping_opening_qty: Opening quantity for scalping (default: 0)
-        no_of_limit_order_retry: Number of limit order retries (default: 0)
-        retry_at_every_seconds: Seconds between retries (default: 0)
-        market_order_after_retry: Place market order after retry fails (default: False)
-        is_auto_rollover: Enable auto rollover for FUT/OPT (default: False)
-        rollover_before_days: Days before expiry to rollover (default: 0)
-        rollover_time: Time to perform rollover in HH:MM (default: "0:0")
-        reset_cycle_by_master_tpsl: Reset cycle on master TP/SL hit (default: False)
-        master_tp_money: Master take profit in money (default: 0)
-        master_sl_money: Master stop loss in money (default: 0)
-        reset_cycle_on_positive_mtm: Reset when MTM reaches this positive value (default: 0)
-        is_trail_sl: Enable trailing stop loss (default: False)
-        profit_move: Points profit to trigger trail (default: 0)
-        sl_move: Points to move SL by (default: 0)
-        no_of_trail_sl: Number of trail SL moves (default: 0)
-        atm: ATM strike offset for options (default: 0)
-        strike_price: Specific strike price for options (default: 0)
-        option_type: Option type - CE or PE (default: "")
-        allow_update_parameters: Allow parameter updates (default: True)
-        is_add_hedge_leg: Add hedge leg to strategy (default: False)
+        advanced: Optional dict of advanced settings; omitted keys keep
+            their defaults. Supported keys (see ScalpingAdvanced in
+            strategy_models for the full schema):
+            contract (NEAR/NEXT/FAR), expiry (MONTHLY/WEEKLY),
+            avg_points (alias for averaging_points), is_intraday,
+            intraday_entry_time, intraday_exit_time, required_margin,
+            product_type (NRML/MIS/CNC),
+            order_type (Market Order/Limit Order),
+            jobbing_start_price, jobbing_end_price,
+            average_by (Point/Percent), target_by (Point/Percent),
+            maximum_target_steps, sqroff_on_maximum_steps,
+            calculate_qty_on_market_jump, increase_qty_on_avg,
+            increase_qty, increase_qty_type (Qty/Lot),
+            scalping_opening_qty, no_of_limit_order_retry,
+            retry_at_every_seconds, market_order_after_retry,
+            is_auto_rollover, rollover_before_days, rollover_time,
+            reset_cycle_by_master_tpsl, master_tp_money, master_sl_money,
+            reset_cycle_on_positive_mtm, is_trail_sl, profit_move,
+            sl_move, no_of_trail_sl, atm, strike_price,
+            option_type (CE/PE), allow_update_parameters, is_add_hedge_leg
 
     Returns:
         API response with strategy ID and deployment status
     """
 
+    # Merge caller-supplied advanced settings over the defaults
+    settings = dict(ADVANCED_DEFAULTS)
+    if advanced:
+        unknown = set(advanced) - set(ADVANCED_DEFAULTS) - {"avg_points"}
+        if unknown:
+            return {
+                "status": "error",
+                "message": f"Unknown advanced parameters: {', '.join(sorted(unknown))}",
+            }
+        try:
+            advanced = _SCALPING_ADVANCED.validate_python(advanced)
+        except ValidationError as e:
+            return {
+                "status": "error",
+                "message": f"Invalid advanced parameters: {e}",
+            }
+        settings.update(advanced)
+
     # Handle alias for averaging_points
+    avg_points = settings.pop("avg_points", None)
     if avg_points is not None:
         averaging_points = avg_points
 
+    # Fast-path validation of the advanced enum settings
+    for name, allowed in (
+        ("contract", _CONTRACTS),
+        ("expiry", _EXPIRIES),
+        ("product_type", _PRODUCT_TYPES),
+        ("order_type", _ORDER_TYPES),
+        ("average_by", _BY_TYPES),
+        ("target_by", _BY_TYPES),
+        ("increase_qty_type", _INCREASE_QTY_TYPES),
+        ("option_type", _OPTION_TYPES),
+    ):
+        if settings[name] not in allowed:
+            return {
+                "status": "error",
+                "message": f"Invalid {name} '{settings[name]}'. Expected one of: "
+                f"{', '.join(sorted(allowed))}",
+            }
+
     # Build mix_name based on segment
-    if segment == "EQ":
-        mix_name = f"{symbol} {segment} {exchange}"
-    else:
-        mix_name = f"{symbol} {segment} {contract} {expiry}"
+    mix_name = (
+        MIX_EQ % (symbol, exchange)
+        if segment == "EQ"
+        else MIX_DERIV % (symbol, segment, settings["contract"], settings["expiry"])
+    )
 
     # Build short and long descriptions
-    short_desc = f"{side} {symbol} at every {averaging_points} points"
-    long_desc = f"{side} {symbol} at every {averaging_points} points down side and book profit at {target_points} points."
-
-    # Create the strategy payload with ALL parameters
-    payload = {
-        "id": "",
-        "strategy_name": strategy_name,
-        "short_description": short_desc,
-        "long_description": long_desc,
-        "strategy_id": "YioJhK5IqBULe8fPLMnXaAaC0$aC0$",  # Scalping plugin ID
-        "mix_name": mix_name,
-        "main_exchange": exchange,
-        "main_segment": segment,
-        "main_symbol": symbol,
-        "main_contract": contract,
-        "main_expiry": expiry,
-        "product_type": product_type,
-        "exit_order_product_type": "",
-        "qty_type": "Qty",
-        "qty": quantity,
-        "lot": lot,
-        "atm": atm,
-        "strike_price": strike_price,
-        "option_type": option_type,
-        "intraday_entry_time": intraday_entry_time,
-        "intraday_exit_time": intraday_exit_time,
-        "is_intraday": is_intraday,
-        "jobbing_side": side,
-        "jobbing_start_price": jobbing_start_price,
-        "jobbing_end_price": jobbing_end_price,
-        "average_by": average_by,
-        "average_value": averaging_points,
-        "target_by": target_by,
-        "target": 0,
-        "intraday_target": target_points,
-        "maximum_steps": max_steps,
-        "maximum_target_steps": maximum_target_steps,
-        "sqroff_on_maximum_steps": sqroff_on_maximum_steps,
-        "calculate_qty_on_market_jump": calculate_qty_on_market_jump,
-        "allow_update_parameters": allow_update_parameters,
-        "order_type": order_type,
-        "no_of_limit_order_retry": no_of_limit_order_retry,
-        "retry_at_every_seconds": retry_at_every_seconds,
-        "market_order_after_retry": market_order_after_retry,
-        "reset_cycle_by_master_tpsl": reset_cycle_by_master_tpsl,
-        "rollover_before_days": rollover_before_days,
-        "is_auto_rollover": is_auto_rollover,
-        "is_add_hedge_leg": is_add_hedge_leg,
-        "rollover_time": rollover_time,
-        "master_tp_money": master_tp_money,
-        "master_sl_money": master_sl_money,
-        "reset_cycle_on_positive_mtm": reset_cycle_on_positive_mtm,
-        "required_margin": required_margin,
-        "is_trail_sl": is_trail_sl,
-        "profit_move": profit_move,
-        "sl_move": sl_move,
-        "no_of_trail_sl": no_of_trail_sl,
-        "scalping_opening_qty": scalping_opening_qty,
-        "increase_qty_on_avg": increase_qty_on_avg,
-        "increase_qty": increase_qty,
-        "increase_qty_type": increase_qty_type,
-        "rebacktest": False,
-        "sub": [],
-        "effect_all_sub_strategies": False,
-    }
+    short_desc = SHORT_DESC % (side, symbol, averaging_points)
+    long_desc = LONG_DESC % (side, symbol, averaging_points, target_points)
+
+    # Create the strategy payload: constant keys come from the base, the
+    # core parameters are patched in explicitly, and the advanced
+    # settings are mapped onto their payload keys
+    payload = make_payload(
+        strategy_name=strategy_name,
+        short_description=short_desc,
+        long_description=long_desc,
+        mix_name=mix_name,
+        main_exchange=exchange,
+        main_segment=segment,
+        main_symbol=symbol,
+        jobbing_side=side,
+        average_value=averaging_points,
+        intraday_target=target_points,
+        maximum_steps=max_steps,
+        qty=quantity,
+        lot=lot,
+    )
+    for name, value in settings.items():
+        payload[PARAM_TO_PAYLOAD.get(name, name)] = value
 
-    logger.info(f"🚀 Creating strategy: {strategy_name} for {symbol}")
-    logger.info(f"   Exchange: {exchange}, Segment: {segment}, Side: {side}")
+    logger.info("🚀 Creating strategy: %s for %s", strategy_name, symbol)
+    logger.info("   Exchange: %s, Segment: %s, Side: %s", exchange, segment, side)
     logger.info(
-        f"   Avg: {averaging_points} pts, Target: {target_points} pts, Max Steps: {max_steps}"
+        "   Avg: %s pts, Target: %s pts, Max Steps: %s",
+        averaging_points,
+        target_points,
+        max_steps,
     )
 
     # Make API call to create the strategy
-    try:
-        logger.info(
-            f"📤 Calling API: {API_BASE_URL}/mainStrategy/createScalpingStrategy"
+    logger.info(_LOG_CALL_CREATE_SCALPING)
+    result = await _call_api(_URL_CREATE_SCALPING, payload)
+    if result["status"] == "error":
+        return result
+
+    api_response = result["data"]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("📥 API Response: %s", api_response)
+
+    # Handle list response (assume success if list is returned)
+    if isinstance(api_response, list):
+        logger.info("✅ API returned a list, assuming success.")
+        # Try to find an ID in the first element if available
+        strategy_id = "N/A"
+        if api_response and isinstance(api_response[0], dict):
+            strategy_id = api_response[0].get("id", "N/A")
+
+        return {
+            "status": "success",
+            "message": f"Strategy '{strategy_name}' created successfully!",
+            "strategy_id": strategy_id,
+            "details": api_response,
+        }
+
+    # Check if response indicates an error
+    if api_response.get("error") or api_response.get("status") == "error":
+        error_msg = api_response.get(
+            "message", api_response.get("error", "Unknown API error")
         )
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                f"{API_BASE_URL}/mainStrategy/createScalpingStrategy",
-                headers=get_auth_headers(),
-                json=payload,
-            )
+        logger.error("❌ API returned error status: %s", error_msg)
+        return {
+            "status": "error",
+            "message": error_msg,
+        }
 
-            logger.info(f"📥 API Response Status: {response.status_code}")
+    logger.info(
+        "✅ Strategy created successfully! ID: %s", api_response.get("id", "N/A")
+    )
+    return {
+        "status": "success",
+        "message": f"Strategy '{strategy_name}' created successfully!",
+        "strategy_id": api_response.get("id", ""),
+    }
 
-            # Check for API errors before raising
-            if response.status_code != 200:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get(
-                        "message", error_data.get("error", response.text)
-                    )
-                except Exception:
-                    error_msg = response.text
-                logger.error(f"❌ API Error: {error_msg}")
-                return {
-                    "status": "error",
-                    "message": f"API returned error: {error_msg}",
-                }
 
-            api_response = response.json()
-            logger.info(f"📥 API Response: {api_response}")
+# ============================================================================
+# BATCH SCALPING STRATEGY TOOL
+# ============================================================================
 
-            # Handle list response (assume success if list is returned)
-            if isinstance(api_response, list):
-                logger.info("✅ API returned a list, assuming success.")
-                # Try to find an ID in the first element if available
-                strategy_id = "N/A"
-                if api_response and isinstance(api_response[0], dict):
-                    strategy_id = api_response[0].get("id", "N/A")
+# Bound how many creates hit the API at once when batching
+_BATCH_LIMIT = asyncio.Semaphore(20)
 
-                return {
-                    "status": "success",
-                    "message": f"Strategy '{strategy_name}' created successfully!",
-                    "strategy_id": strategy_id,
-                    "details": api_response,
-                }
+# Validators compiled once at import and reused across calls. TypedDict
+# validation silently drops unknown keys, so items are checked against
+# the declared keys first — a typoed parameter must fail loudly rather
+# than create a strategy with that parameter's default.
+_SCALPING_ITEM = TypeAdapter(ScalpingParams)
+_SCALPING_ITEMS = TypeAdapter(List[ScalpingParams])
+_SCALPING_KEYS = frozenset(ScalpingParams.__annotations__)
 
-            # Check if response indicates an error
-            if api_response.get("error") or api_response.get("status") == "error":
-                error_msg = api_response.get(
-                    "message", api_response.get("error", "Unknown API error")
-                )
-                logger.error(f"❌ API returned error status: {error_msg}")
+
+def _unknown_scalping_keys(params) -> Optional[str]:
+    """Return an error message if params carries undeclared keys."""
+    if isinstance(params, dict):
+        unknown = set(params) - _SCALPING_KEYS
+        if unknown:
+            return f"Unknown parameters: {', '.join(sorted(unknown))}"
+    return None
+
+
+@mcp.tool()
+async def create_scalping_strategies_batch(items: List[dict]) -> List[dict]:
+    """
+    Create multiple scalping strategies in parallel.
+
+    Each item is a dict of create_scalping_strategy parameters (e.g.
+    {"strategy_name": "RELIANCE Scalping", "symbol": "RELIANCE", ...}).
+    All creates are dispatched concurrently over the shared HTTP client,
+    so N strategies complete in roughly one round-trip instead of N.
+
+    Args:
+        items: List of parameter sets, one per strategy to create
+
+    Returns:
+        List of per-strategy results in the same order as the input
+    """
+
+    for index, item in enumerate(items):
+        unknown = _unknown_scalping_keys(item)
+        if unknown:
+            return [
+                {"status": "error", "message": f"Invalid item {index}: {unknown}"}
+            ]
+    try:
+        items = _SCALPING_ITEMS.validate_python(items)
+    except ValidationError as e:
+        return [{"status": "error", "message": f"Invalid batch items: {e}"}]
+
+    async def _one(params: dict) -> dict:
+        async with _BATCH_LIMIT:
+            try:
+                return await create_scalping_strategy.fn(**params)
+            except TypeError as e:
                 return {
                     "status": "error",
-                    "message": error_msg,
+                    "message": f"Invalid parameters: {e}",
                 }
 
-            logger.info(
-                f"✅ Strategy created successfully! ID: {api_response.get('id', 'N/A')}"
-            )
-            return {
-                "status": "success",
-                "message": f"Strategy '{strategy_name}' created successfully!",
-                "strategy_id": api_response.get("id", ""),
-            }
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ HTTP Error: {e}")
-        try:
-            error_data = e.response.json()
-            error_msg = error_data.get("message", error_data.get("error", str(e)))
-        except Exception:
-            error_msg = e.response.text
-        logger.error(f"❌ Error message: {error_msg}")
-        return {
-            "status": "error",
-            "message": f"API error: {error_msg}",
-        }
-    except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
-        import traceback
+    logger.info("🚀 Creating %d strategies in parallel", len(items))
+    return list(await asyncio.gather(*(_one(item) for item in items)))
 
-        logger.error(f"❌ Traceback: {traceback.format_exc()}")
-        return {
-            "status": "error",
-            "message": f"Failed to create strategy: {str(e)}",
-        }
+
+# Reusable msgpack encoder for the binary tool variant
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+
+
+@mcp.tool()
+async def create_scalping_strategy_binary(params: dict) -> str:
+    """
+    Binary variant of create_scalping_strategy for bulk/scripted clients.
+
+    Takes the same parameters as create_scalping_strategy as a single
+    dict and returns the result as base64-encoded msgpack (decode with
+    msgspec.msgpack.decode(base64.b64decode(result))) — compact and fast
+    to decode client-side. Use the JSON tool for interactive use.
+
+    Args:
+        params: create_scalping_strategy parameters as a dict
+
+    Returns:
+        Base64-encoded msgpack result
+    """
+    unknown = _unknown_scalping_keys(params)
+    if unknown:
+        result = {"status": "error", "message": unknown}
+    else:
+        try:
+            params = _SCALPING_ITEM.validate_python(params)
+            result = await create_scalping_strategy.fn(**params)
+        except (TypeError, ValidationError) as e:
+            result = {"status": "error", "message": f"Invalid parameters: {e}"}
+    return base64.b64encode(_MSGPACK_ENCODER.encode(result)).decode("ascii")
 
 
 # ============================================================================
 # GET MY STRATEGIES TOOL
 # ============================================================================
 
+# Pre-bound extractor over the upstream row fields, in StrategyOut field
+# order, so each row projects in one attrgetter call + one Struct build
+_STRAT_FIELDS = operator.attrgetter(
+    "id",
+    "sid",
+    "strategy_name",
+    "plugin_name",
+    "main_symbol",
+    "trading_type",
+    "required_margin_format",
+    "is_deployed",
+    "created_on",
+    "type",
+)
+
 
 @mcp.tool()
-def get_my_strategies(
+async def get_my_strategies(
     skip: int = 0,
     take: int = 10,
     search: str = "",
     symbols: Optional[List[str]] = None,
     trading_type: Literal["All", "INTRADAY", "POSITIONAL"] = "All",
     sort_by: Literal["newest", "oldest", "name"] = "newest",
+    include_backtest: bool = False,
 ) -> dict:
     """
     Get list of user's trading strategies from MarketMaya.
@@ -358,6 +583,8 @@ def get_my_strategies(
         symbols: List of symbols to filter by (default: None for all)
         trading_type: Filter by trading type - All, INTRADAY, POSITIONAL (default: All)
         sort_by: Sort order - newest, oldest, name (default: newest)
+        include_backtest: Also fetch backtest options for each strategy,
+            in parallel (default: False)
 
     Returns:
         List of strategies with their details
@@ -377,56 +604,107 @@ def get_my_strategies(
     }
 
     # Make API call
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                f"{API_BASE_URL}/V3/mainStrategy/getClientMyStrategy",
-                headers=get_auth_headers(),
-                json=payload,
+    result = await _call_api(
+        _URL_GET_MY_STRATEGIES,
+        payload,
+        decoder=lambda r: msgspec.json.decode(r.content, type=StrategiesPage),
+    )
+    if result["status"] == "error":
+        return result
+    page = result["data"]
+
+    # Extract relevant data
+    strategies = [StrategyOut(*_STRAT_FIELDS(row)) for row in page.data]
+
+    # Optionally prefetch backtest options for every strategy in one
+    # concurrent sweep instead of N sequential tool calls. The endpoint
+    # wants the encrypted sid, not the numeric id.
+    if include_backtest and strategies:
+        results = await asyncio.gather(
+            *(
+                _call_api(_URL_GET_BACKTEST_OPTIONS, {"id": s.sid})
+                for s in strategies
             )
-            response.raise_for_status()
-            api_response = response.json()
-
-            # Extract relevant data
-            strategies = []
-            for strategy in api_response.get("data", []):
-                strategies.append(
-                    {
-                        "id": strategy.get("id"),
-                        "sid": strategy.get("sid"),
-                        "name": strategy.get("strategy_name"),
-                        "plugin": strategy.get("plugin_name"),
-                        "symbol": strategy.get("main_symbol"),
-                        "trading_type": strategy.get("trading_type"),
-                        "required_margin": strategy.get("required_margin_format"),
-                        "is_deployed": strategy.get("is_deployed"),
-                        "created_on": strategy.get("created_on"),
-                        "type": strategy.get("type"),
-                    }
-                )
+        )
+        for s, r in zip(strategies, results):
+            s.backtest_options = r["data"] if r["status"] == "success" else r
 
-            return {
-                "status": "success",
-                "total": api_response.get("total", 0),
-                "strategies": strategies,
-                "available_symbols": api_response.get("symbols", []),
-            }
-    except httpx.HTTPStatusError as e:
-        return {
-            "status": "error",
-            "message": f"API error: {e.response.status_code} - {e.response.text}",
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "message": f"Failed to fetch strategies: {str(e)}",
-        }
+    # Convert the Structs to plain dicts at the boundary: FastMCP's
+    # structured-content path serializes dict results with pydantic,
+    # which doesn't know msgspec types.
+    return {
+        "status": "success",
+        "total": page.total,
+        "strategies": msgspec.to_builtins(strategies),
+        "available_symbols": page.symbols,
+    }
 
 
 # ============================================================================
 # KNOWLEDGE BASE TOOL
 # ============================================================================
 
+# Knowledge-base answers are cached for an hour: the KB content changes
+# rarely and agents re-ask near-identical questions, so repeat queries
+# skip the multi-second (and metered) Gemini call entirely.
+_KB_CACHE: dict = {}
+_KB_CACHE_LOCK = threading.Lock()
+_KB_CACHE_TTL = 3600.0
+_KB_CACHE_MAX = 256
+
+
+def _kb_cache_get(key: str) -> Optional[str]:
+    """Return a cached answer for the normalized query, or None."""
+    with _KB_CACHE_LOCK:
+        entry = _KB_CACHE.get(key)
+        if entry is None:
+            return None
+        ts, text = entry
+        if time.monotonic() - ts > _KB_CACHE_TTL:
+            del _KB_CACHE[key]
+            return None
+        return text
+
+
+def _kb_cache_put(key: str, text: str) -> None:
+    """Store an answer, evicting the oldest entry when full."""
+    with _KB_CACHE_LOCK:
+        if len(_KB_CACHE) >= _KB_CACHE_MAX:
+            _KB_CACHE.pop(next(iter(_KB_CACHE)), None)
+        _KB_CACHE[key] = (time.monotonic(), text)
+
+
+# The genai client (and the file-search tool config, whose store name is
+# env-derived and stable) is built once and shared: client construction
+# sets up auth/transport state that would otherwise be repeated per query.
+_GENAI_CLIENT = None
+_GENAI_FILE_SEARCH = None
+_GENAI_LOCK = threading.Lock()
+
+
+def _genai() -> tuple:
+    """Return the shared (client, file_search_tool) pair, building it on
+    first use."""
+    global _GENAI_CLIENT, _GENAI_FILE_SEARCH
+    if _GENAI_CLIENT is None:
+        # Imported lazily so MCP startup doesn't pay for the genai SDK;
+        # sys.modules makes repeat calls free.
+        from google import genai
+        from google.genai import types
+
+        with _GENAI_LOCK:
+            if _GENAI_CLIENT is None:
+                _GENAI_FILE_SEARCH = types.Tool(
+                    file_search=types.FileSearch(
+                        file_search_store_names=[os.getenv("MMCOPILOT_STORE_NAME")],
+                        top_k=5,
+                    )
+                )
+                _GENAI_CLIENT = genai.Client(
+                    api_key=os.getenv("GEMINI_API_KEY"), vertexai=False
+                )
+    return _GENAI_CLIENT, _GENAI_FILE_SEARCH
+
 
 @mcp.tool()
 def search_knowledge_base(query: str) -> str:
@@ -441,6 +719,12 @@ def search_knowledge_base(query: str) -> str:
     Returns:
         Relevant text chunks from the knowledge base.
     """
+    # Serve repeat questions from the cache before touching Gemini
+    cache_key = re.sub(r"\s+", " ", query.strip().lower())
+    cached = _kb_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     api_key = os.getenv("GEMINI_API_KEY")
     store_name = os.getenv("MMCOPILOT_STORE_NAME")
 
@@ -451,14 +735,11 @@ def search_knowledge_base(query: str) -> str:
         return "Error: Knowledge base not configured (MMCOPILOT_STORE_NAME missing)."
 
     try:
-        client = genai.Client(api_key=api_key, vertexai=False)
+        from google.genai import types
 
-        model = "gemini-2.5-flash-lite"
+        client, file_search_tool = _genai()
 
-        # Configure the tool
-        file_search_tool = types.Tool(
-            file_search=types.FileSearch(file_search_store_names=[store_name], top_k=5)
-        )
+        model = "gemini-2.5-flash-lite"
 
         # Ask the model to retrieve
         response = client.models.generate_content(
@@ -471,49 +752,50 @@ def search_knowledge_base(query: str) -> str:
         )
 
         if response.text:
+            _kb_cache_put(cache_key, response.text)
             return response.text
         else:
             return "No relevant information found in the knowledge base."
 
     except Exception as e:
-        logger.error(f"Search error: {e}")
+        logger.exception("Search error")
         return f"Error searching knowledge base: {str(e)}"
 
 
+@mcp.tool()
+def search_knowledge_base_clear_cache() -> str:
+    """
+    Clear cached knowledge base search results.
+
+    Use after the knowledge base content has been updated so searches
+    return fresh answers instead of hour-old cached ones.
+
+    Returns:
+        Confirmation with the number of entries cleared.
+    """
+    with _KB_CACHE_LOCK:
+        count = len(_KB_CACHE)
+        _KB_CACHE.clear()
+    return f"Cleared {count} cached knowledge base entries."
+
+
 # ============================================================================
 # GET POINT BALANCE TOOL
 # ============================================================================
 
 
 @mcp.tool()
-def get_point_balance() -> dict:
+async def get_point_balance() -> dict:
     """
     Get the user's current point balance from MarketMaya.
 
     Returns:
         Dictionary containing point_balance, hold_balance, and total balance
     """
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                f"{API_BASE_URL}/client/v2/getPointBalance",
-                headers=get_auth_headers(),
-                json={},
-            )
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ HTTP Error: {e}")
-        return {
-            "status": "error",
-            "message": f"API error: {e.response.status_code} - {e.response.text}",
-        }
-    except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
-        return {
-            "status": "error",
-            "message": f"Failed to fetch balance: {str(e)}",
-        }
+    result = await _call_api(_URL_GET_POINT_BALANCE, {})
+    if result["status"] == "error":
+        return result
+    return result["data"]
 
 
 # ============================================================================
@@ -522,7 +804,7 @@ def get_point_balance() -> dict:
 
 
 @mcp.tool()
-def get_backtest_options(strategy_id: str) -> dict:
+async def get_backtest_options(strategy_id: str) -> dict:
     """
     Get backtest options for a specific strategy.
 
@@ -532,42 +814,61 @@ def get_backtest_options(strategy_id: str) -> dict:
     Returns:
         Dictionary containing available backtest options.
     """
-    logger.info(f"Fetching backtest options for strategy_id: {strategy_id}")
+    logger.info("Fetching backtest options for strategy_id: %s", strategy_id)
     
     # Ensure ID is a string and strip whitespace
     clean_id = str(strategy_id).strip()
     payload = {"id": clean_id}
     
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            # Use json parameter which httpx handles correctly (sets Content-Type and Content-Length)
-            # But we'll log what we're sending
-            logger.info(f"Sending payload: {payload}")
-            
-            response = client.post(
-                f"{API_BASE_URL}/subscription/getBacktestOptions",
-                headers=get_auth_headers(),
-                json=payload,
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Sending payload: %s", payload)
+
+    result = await _call_api(_URL_GET_BACKTEST_OPTIONS, payload)
+    if result["status"] == "error":
+        return result
+    return result["data"]
+
+
+# Bound how many backtest-option fetches run at once when bulk fetching
+_BULK_BACKTEST_LIMIT = asyncio.Semaphore(16)
+
+
+@mcp.tool()
+async def get_backtest_options_bulk(strategy_ids: List[str]) -> dict:
+    """
+    Get backtest options for multiple strategies in one call.
+
+    Issues the per-strategy requests concurrently over the shared HTTP
+    client, so N strategies cost roughly one round-trip instead of N
+    sequential get_backtest_options calls.
+
+    Args:
+        strategy_ids: Encrypted strategy IDs (same form as get_backtest_options)
+
+    Returns:
+        Mapping of each strategy_id to its backtest options (or error)
+    """
+
+    async def _one(sid: str) -> tuple:
+        async with _BULK_BACKTEST_LIMIT:
+            result = await _call_api(
+                _URL_GET_BACKTEST_OPTIONS, {"id": str(sid).strip()}
             )
-            
-            if response.status_code != 200:
-                logger.error(f"❌ API Error {response.status_code}: {response.text}")
-            
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ HTTP Error: {e}")
-        return {
-            "status": "error",
-            "message": f"API error: {e.response.status_code} - {e.response.text}",
-        }
-    except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
-        return {
-            "status": "error",
-            "message": f"Failed to fetch backtest options: {str(e)}",
-        }
+        return sid, result["data"] if result["status"] == "success" else result
+
+    logger.info("Fetching backtest options for %d strategies", len(strategy_ids))
+    results = dict(await asyncio.gather(*(_one(sid) for sid in strategy_ids)))
+    return {"status": "success", "results": results}
 
 
 if __name__ == "__main__":
+    # Run the asyncio loop on uvloop where available (Linux/macOS) for
+    # fewer syscalls and lower latency under concurrent tool traffic.
+    try:
+        import uvloop
+
+        uvloop.install()
+        logger.info("uvloop installed as the event loop policy")
+    except ImportError:
+        pass
     mcp.run()
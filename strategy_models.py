@@ -0,0 +1,207 @@
+# strategy_models.py
+"""Payload templates and response schemas for MarketMaya strategies.
+
+Kept separate from the FastMCP entrypoint so the hot construction and
+decode paths can be AOT-compiled (e.g. mypyc) without freezing the
+server module, which stays plain Python for reload-on-edit.
+"""
+
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, TypedDict
+import functools
+
+import msgspec
+
+# Description templates, parsed once at import instead of per call
+SHORT_DESC = "%s %s at every %d points"
+LONG_DESC = SHORT_DESC + " down side and book profit at %d points."
+
+# mix_name templates: equity names carry the exchange, derivatives carry
+# contract and expiry
+MIX_EQ = "%s EQ %s"
+MIX_DERIV = "%s %s %s %s"
+
+
+@functools.cache
+def base_payload() -> Mapping[str, Any]:
+    """Keys of the scalping payload that never vary between calls."""
+    return MappingProxyType(
+        {
+            "id": "",
+            "strategy_id": "YioJhK5IqBULe8fPLMnXaAaC0$aC0$",  # Scalping plugin ID
+            "exit_order_product_type": "",
+            "qty_type": "Qty",
+            "target": 0,
+            "rebacktest": False,
+            "sub": [],
+            "effect_all_sub_strategies": False,
+        }
+    )
+
+
+def make_payload(**overrides: Any) -> dict:
+    """Build a scalping payload from the invariant base plus overrides."""
+    payload = dict(base_payload())
+    payload.update(overrides)
+    return payload
+
+
+class ScalpingAdvanced(TypedDict, total=False):
+    """Advanced create_scalping_strategy settings, passed as the
+    `advanced` dict. Every key is optional; omitted keys fall back to
+    the defaults in ADVANCED_DEFAULTS."""
+
+    contract: str
+    expiry: str
+    avg_points: int
+    is_intraday: bool
+    intraday_entry_time: str
+    intraday_exit_time: str
+    required_margin: int
+    product_type: str
+    order_type: str
+    jobbing_start_price: float
+    jobbing_end_price: float
+    average_by: str
+    target_by: str
+    maximum_target_steps: int
+    sqroff_on_maximum_steps: bool
+    calculate_qty_on_market_jump: bool
+    increase_qty_on_avg: bool
+    increase_qty: int
+    increase_qty_type: str
+    scalping_opening_qty: int
+    no_of_limit_order_retry: int
+    retry_at_every_seconds: int
+    market_order_after_retry: bool
+    is_auto_rollover: bool
+    rollover_before_days: int
+    rollover_time: str
+    reset_cycle_by_master_tpsl: bool
+    master_tp_money: int
+    master_sl_money: int
+    reset_cycle_on_positive_mtm: int
+    is_trail_sl: bool
+    profit_move: int
+    sl_move: int
+    no_of_trail_sl: int
+    atm: int
+    strike_price: int
+    option_type: str
+    allow_update_parameters: bool
+    is_add_hedge_leg: bool
+
+
+class ScalpingParams(TypedDict, total=False):
+    """Parameter set accepted by create_scalping_strategy, as one item of
+    a batch. Only strategy_name and symbol are effectively required;
+    everything else falls back to the tool defaults."""
+
+    strategy_name: str
+    symbol: str
+    exchange: str
+    segment: str
+    side: str
+    averaging_points: int
+    target_points: int
+    max_steps: int
+    quantity: int
+    lot: int
+    advanced: ScalpingAdvanced
+
+
+# Defaults for every advanced setting (avg_points is an alias handled by
+# the tool, so it carries no default here)
+ADVANCED_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        "contract": "NEAR",
+        "expiry": "MONTHLY",
+        "is_intraday": True,
+        "intraday_entry_time": "9:16",
+        "intraday_exit_time": "15:25",
+        "required_margin": 100000,
+        "product_type": "NRML",
+        "order_type": "Market Order",
+        "jobbing_start_price": 0,
+        "jobbing_end_price": 0,
+        "average_by": "Point",
+        "target_by": "Point",
+        "maximum_target_steps": 0,
+        "sqroff_on_maximum_steps": False,
+        "calculate_qty_on_market_jump": False,
+        "increase_qty_on_avg": False,
+        "increase_qty": 0,
+        "increase_qty_type": "Qty",
+        "scalping_opening_qty": 0,
+        "no_of_limit_order_retry": 0,
+        "retry_at_every_seconds": 0,
+        "market_order_after_retry": False,
+        "is_auto_rollover": False,
+        "rollover_before_days": 0,
+        "rollover_time": "0:0",
+        "reset_cycle_by_master_tpsl": False,
+        "master_tp_money": 0,
+        "master_sl_money": 0,
+        "reset_cycle_on_positive_mtm": 0,
+        "is_trail_sl": False,
+        "profit_move": 0,
+        "sl_move": 0,
+        "no_of_trail_sl": 0,
+        "atm": 0,
+        "strike_price": 0,
+        "option_type": "CE",
+        "allow_update_parameters": True,
+        "is_add_hedge_leg": False,
+    }
+)
+
+# Advanced settings whose payload key differs from the parameter name
+PARAM_TO_PAYLOAD: Mapping[str, str] = MappingProxyType(
+    {
+        "contract": "main_contract",
+        "expiry": "main_expiry",
+    }
+)
+
+
+class StrategyRow(msgspec.Struct):
+    """The subset of upstream strategy fields we project; everything else
+    is skipped at decode time instead of materialized into dicts."""
+
+    # ids come back numeric or encrypted depending on endpoint version
+    id: Any = None
+    sid: Any = None
+    strategy_name: Optional[str] = None
+    plugin_name: Optional[str] = None
+    main_symbol: Optional[str] = None
+    trading_type: Optional[str] = None
+    required_margin_format: Optional[str] = None
+    is_deployed: Optional[bool] = None
+    created_on: Optional[str] = None
+    type: Any = None
+
+
+class StrategiesPage(msgspec.Struct):
+    data: List[StrategyRow] = []
+    total: int = 0
+    symbols: List[Any] = []
+
+
+class StrategyOut(msgspec.Struct):
+    """Slim per-strategy projection returned by get_my_strategies.
+
+    Field order matches the extractor in main.py so rows build from a
+    single positional call.
+    """
+
+    id: Any = None
+    sid: Any = None
+    name: Optional[str] = None
+    plugin: Optional[str] = None
+    symbol: Optional[str] = None
+    trading_type: Optional[str] = None
+    required_margin: Optional[str] = None
+    is_deployed: Optional[bool] = None
+    created_on: Optional[str] = None
+    type: Any = None
+    backtest_options: Any = None